@@ -0,0 +1,105 @@
+"""响应缓存后端：进程内 LRU（带过期时间）与可选的 Redis 共享后端"""
+import collections
+import threading
+import time
+
+try:
+    import redis
+except ImportError:  # redis 为可选依赖，未安装时只能使用进程内缓存
+    redis = None
+
+
+def _size(value):
+    return len(value) if isinstance(value, (bytes, str)) else 0
+
+
+class MemoryBackend:
+    """进程内 LRU 缓存，同时限制条目数和总字节数，也可作为共享后端的本地替身用于测试"""
+
+    def __init__(self, max_entries=1024, default_ttl=None, max_bytes=None):
+        self._items = collections.OrderedDict()  # key -> (过期时间, 值)
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self._default_ttl = default_ttl
+        self._lock = threading.Lock()
+
+    @property
+    def size_bytes(self):
+        return self._bytes
+
+    def _remove(self, key):
+        _, value = self._items.pop(key)
+        self._bytes -= _size(value)
+
+    def get(self, key):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl=None):
+        ttl = ttl if ttl is not None else self._default_ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+        with self._lock:
+            if key in self._items:
+                self._remove(key)
+            # 超过总容量的单个值不缓存
+            if self._max_bytes is not None and _size(value) > self._max_bytes:
+                return
+            self._items[key] = (expires_at, value)
+            self._bytes += _size(value)
+            while len(self._items) > self._max_entries or (
+                    self._max_bytes is not None and self._bytes > self._max_bytes):
+                self._remove(next(iter(self._items)))
+
+    def add(self, key, value):
+        """键不存在时写入（不过期），返回是否写入成功"""
+        with self._lock:
+            if key in self._items:
+                return False
+            self._items[key] = (None, value)
+            self._bytes += _size(value)
+            return True
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+
+class RedisBackend:
+    """基于 Redis 的共享缓存，多个 worker 共享集合版本号和响应体"""
+
+    def __init__(self, url, default_ttl=None):
+        if redis is None:
+            raise RuntimeError('未安装 redis，无法使用共享缓存后端')
+        self._client = redis.Redis.from_url(url)
+        self._default_ttl = default_ttl
+
+    def get(self, key):
+        return self._client.get(key)
+
+    def set(self, key, value, ttl=None):
+        ttl = ttl if ttl is not None else self._default_ttl
+        self._client.set(key, value, ex=ttl or None)
+
+    def add(self, key, value):
+        return bool(self._client.set(key, value, nx=True))
+
+
+def create_shared_backend(config):
+    """根据配置创建共享后端，未配置时返回 None"""
+    kind = config.get('CACHE_SHARED_BACKEND')
+    if kind == 'redis':
+        return RedisBackend(config['CACHE_REDIS_URL'], config.get('CACHE_TTL'))
+    if kind == 'memory':
+        return MemoryBackend(config.get('CACHE_LOCAL_MAX_ENTRIES', 1024), config.get('CACHE_TTL'),
+                             config.get('CACHE_LOCAL_MAX_BYTES'))
+    return None
@@ -0,0 +1,103 @@
+"""数据驱动的可视化图表：由聚合数据生成图表描述（JSON），并渲染为图片"""
+import hashlib
+import json
+import os
+
+try:
+    import matplotlib
+    matplotlib.use('Agg')
+    from matplotlib import pyplot as plt
+except ImportError:  # matplotlib 为可选依赖，未安装时只生成 JSON 图表描述
+    plt = None
+
+CHART_FONTS = ['SimHei', 'Noto Sans CJK SC', 'WenQuanYi Micro Hei', 'Microsoft YaHei', 'DejaVu Sans']
+
+
+def build_trend_spec(title, rows):
+    """rows: [(月份 'YYYY-MM', 文档数)]"""
+    return {
+        'chart': 'line',
+        'title': title,
+        'x': [month for month, _ in rows],
+        'series': [{'name': '文档数', 'data': [count for _, count in rows]}]
+    }
+
+
+def build_timeline_spec(title, rows):
+    """rows: [(发布日期 'YYYY-MM-DD', 标题)]，按日期升序"""
+    return {
+        'chart': 'timeline',
+        'title': title,
+        'events': [{'date': date, 'title': event} for date, event in rows]
+    }
+
+
+def build_keyword_spec(title, weights, limit=50):
+    """weights: {关键词: 权重}"""
+    top = sorted(weights.items(), key=lambda item: (-item[1], item[0]))[:limit]
+    return {
+        'chart': 'keyword_cloud',
+        'title': title,
+        'words': [{'text': word, 'weight': weight} for word, weight in top]
+    }
+
+
+def spec_version(spec):
+    """图表描述的内容哈希，作为数据版本写入文件名"""
+    data = json.dumps(spec, ensure_ascii=False, sort_keys=True).encode('utf-8')
+    return hashlib.sha1(data).hexdigest()[:16]
+
+
+def can_render_images():
+    return plt is not None
+
+
+def render_chart(spec, image_path, spec_path):
+    """把图表描述写成 JSON 并渲染为 PNG；在进程池中执行，只依赖参数本身"""
+    tmp_spec = spec_path + '.tmp'
+    with open(tmp_spec, 'w', encoding='utf-8') as f:
+        json.dump(spec, f, ensure_ascii=False)
+    os.replace(tmp_spec, spec_path)
+
+    if plt is None:
+        return spec_path, None
+
+    plt.rcParams['font.sans-serif'] = CHART_FONTS
+    plt.rcParams['axes.unicode_minus'] = False
+    fig, ax = plt.subplots(figsize=(10, 5), dpi=100)
+    try:
+        if spec['chart'] == 'line':
+            for series in spec['series']:
+                ax.plot(spec['x'], series['data'], marker='o', label=series['name'])
+            ax.set_ylabel('文档数')
+            step = max(len(spec['x']) // 12, 1)
+            ax.set_xticks(range(0, len(spec['x']), step))
+            ax.set_xticklabels(spec['x'][::step], rotation=45, ha='right')
+        elif spec['chart'] == 'timeline':
+            events = spec['events']
+            ax.hlines(0, 0, max(len(events) - 1, 1), color='#999999')
+            for i, event in enumerate(events):
+                offset = 1 if i % 2 == 0 else -1
+                ax.plot(i, 0, 'o', color='#409eff')
+                ax.vlines(i, 0, offset * 0.6, color='#c0c4cc')
+                ax.text(i, offset * 0.7, f"{event['date']}\n{event['title'][:16]}",
+                        ha='center', va='bottom' if offset > 0 else 'top', fontsize=8)
+            ax.set_ylim(-1.6, 1.6)
+            ax.axis('off')
+        elif spec['chart'] == 'keyword_cloud':
+            words = spec['words']
+            top_weight = max((w['weight'] for w in words), default=1) or 1
+            columns = 6
+            for i, word in enumerate(words):
+                ax.text((i % columns + 0.5) / columns, 1 - (i // columns + 0.5) / (len(words) // columns + 1),
+                        word['text'], ha='center', va='center',
+                        fontsize=10 + 22 * word['weight'] / top_weight, transform=ax.transAxes)
+            ax.axis('off')
+        ax.set_title(spec['title'])
+        fig.tight_layout()
+        tmp_image = image_path + '.tmp.png'
+        fig.savefig(tmp_image, format='png')
+        os.replace(tmp_image, image_path)
+    finally:
+        plt.close(fig)
+    return spec_path, image_path
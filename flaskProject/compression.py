@@ -0,0 +1,63 @@
+"""响应压缩工具：根据 Accept-Encoding 协商 br / gzip，并对响应体进行压缩"""
+import gzip
+
+try:
+    import brotli
+except ImportError:  # brotli 为可选依赖，未安装时只提供 gzip
+    brotli = None
+
+# 小于该字节数的响应不值得压缩
+MIN_COMPRESS_SIZE = 1024
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+def supported_encodings():
+    """按优先级返回服务端支持的编码"""
+    if brotli is not None:
+        return ['br', 'gzip']
+    return ['gzip']
+
+
+def parse_accept_encoding(header):
+    """解析 Accept-Encoding 头，返回 {编码: q值}"""
+    result = {}
+    if not header:
+        return result
+    for part in header.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        name, _, params = part.partition(';')
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        result[name.strip().lower()] = q
+    return result
+
+
+def choose_encoding(header):
+    """选择客户端可接受且 q 值最高的编码，无可用编码时返回 None"""
+    accepted = parse_accept_encoding(header)
+    best = None
+    best_q = 0.0
+    for encoding in supported_encodings():
+        q = accepted.get(encoding, accepted.get('*', 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def compress(data, encoding):
+    """使用指定编码压缩字节串"""
+    if encoding == 'br':
+        return brotli.compress(data, quality=BROTLI_QUALITY)
+    if encoding == 'gzip':
+        # mtime 固定为 0，保证相同内容压缩结果一致
+        return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+    return data
@@ -0,0 +1,54 @@
+"""长文档分块：按段落切分正文，生成 (偏移, 长度, 标题) 偏移索引"""
+import re
+
+TARGET_CHUNK_CHARS = 4000
+MAX_CHUNK_CHARS = 8000
+HEADING_CHARS = 40
+
+_HEADING = re.compile(r'^(第[一二三四五六七八九十百零〇\d]+[章节条部分]|[一二三四五六七八九十]+、|\d+[.、])')
+
+
+def _heading(text):
+    for line in text.split('\n'):
+        line = line.strip()
+        if line:
+            return line if len(line) <= HEADING_CHARS else line[:HEADING_CHARS] + '…'
+    return ''
+
+
+def split_paragraphs(content):
+    """返回段落的 (偏移, 长度)，段落包含结尾的换行符，拼接后与原文一致"""
+    spans = []
+    offset = 0
+    for line in content.splitlines(keepends=True):
+        spans.append((offset, len(line)))
+        offset += len(line)
+    return spans
+
+
+def chunk_content(content, target=TARGET_CHUNK_CHARS, maximum=MAX_CHUNK_CHARS):
+    """把正文切成若干块，返回 [(偏移, 长度, 标题)]；块边界尽量落在段落之间，遇到章节标题优先断开"""
+    if not content:
+        return []
+    chunks = []
+    start = 0
+    length = 0
+    for offset, size in split_paragraphs(content):
+        paragraph = content[offset:offset + size]
+        starts_section = bool(_HEADING.match(paragraph.strip()))
+        if length and (length + size > maximum or length >= target or (starts_section and length >= target // 2)):
+            chunks.append((start, length))
+            start, length = offset, 0
+        # 超长段落硬切分
+        while size > maximum:
+            if length:
+                chunks.append((start, length))
+                start, length = offset, 0
+            chunks.append((offset, maximum))
+            offset += maximum
+            size -= maximum
+            start = offset
+        length += size
+    if length:
+        chunks.append((start, length))
+    return [(offset, size, _heading(content[offset:offset + size])) for offset, size in chunks]
@@ -0,0 +1,38 @@
+"""正文压缩编解码：基于 zstd 与针对本语料训练的字典"""
+try:
+    import zstandard
+except ImportError:  # zstandard 为可选依赖，未安装时只能以明文存储
+    zstandard = None
+
+COMPRESSION_LEVEL = 19
+DICTIONARY_SIZE = 112 * 1024
+
+
+def available():
+    return zstandard is not None
+
+
+def train_dictionary(samples, dict_size=DICTIONARY_SIZE):
+    """用正文样本训练 zstd 字典，返回 (dict_id, 字典字节)"""
+    encoded = [s.encode('utf-8') for s in samples if s]
+    dictionary = zstandard.train_dictionary(dict_size, encoded)
+    return dictionary.dict_id(), dictionary.as_bytes()
+
+
+def load_dictionary(data):
+    return zstandard.ZstdCompressionDict(data)
+
+
+def compress_text(text, dictionary=None):
+    compressor = zstandard.ZstdCompressor(level=COMPRESSION_LEVEL, dict_data=dictionary)
+    return compressor.compress(text.encode('utf-8'))
+
+
+def frame_dict_id(data):
+    """读取压缩帧头中记录的字典ID，未使用字典时为0"""
+    return zstandard.get_frame_parameters(data).dict_id
+
+
+def decompress_text(data, dictionary=None):
+    decompressor = zstandard.ZstdDecompressor(dict_data=dictionary)
+    return decompressor.decompress(data).decode('utf-8')
@@ -0,0 +1,146 @@
+"""来源网页抓取：基于 asyncio 的并发抓取，支持条件请求与内容哈希变化检测"""
+import asyncio
+import hashlib
+import re
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urldefrag
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp 为可选依赖，只有抓取命令需要
+    aiohttp = None
+
+USER_AGENT = 'LiiuxueCrawler/1.0'
+
+
+class FetchResult:
+    def __init__(self, url, status, text=None, etag=None, last_modified=None, error=None):
+        self.url = url
+        self.status = status
+        self.text = text
+        self.etag = etag
+        self.last_modified = last_modified
+        self.error = error
+
+    @property
+    def not_modified(self):
+        return self.status == 304
+
+    @property
+    def ok(self):
+        return self.status == 200 and self.text is not None
+
+
+def content_hash(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class _ArticleParser(HTMLParser):
+    _SKIP_TAGS = {'script', 'style', 'noscript', 'nav', 'header', 'footer'}
+    _BLOCK_TAGS = {'p', 'div', 'br', 'li', 'h1', 'h2', 'h3', 'h4', 'tr', 'section', 'article'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = ''
+        self.h1 = ''
+        self.links = []
+        self._parts = []
+        self._stack = []
+        self._skip = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self._SKIP_TAGS:
+            self._skip += 1
+        if tag == 'a':
+            href = dict(attrs).get('href')
+            if href:
+                self.links.append(href)
+        if tag in self._BLOCK_TAGS:
+            self._parts.append('\n')
+        self._stack.append(tag)
+
+    def handle_endtag(self, tag):
+        if tag in self._SKIP_TAGS and self._skip:
+            self._skip -= 1
+        if tag in self._BLOCK_TAGS:
+            self._parts.append('\n')
+        if self._stack and self._stack[-1] == tag:
+            self._stack.pop()
+
+    def handle_data(self, data):
+        current = self._stack[-1] if self._stack else None
+        if current == 'title':
+            self.title += data
+        elif current == 'h1' and not self._skip:
+            self.h1 += data
+        if not self._skip and current not in ('title', 'h1'):
+            self._parts.append(data)
+
+    def text(self):
+        lines = (re.sub(r'[ \t　\xa0]+', ' ', line).strip() for line in ''.join(self._parts).split('\n'))
+        return '\n'.join(line for line in lines if line)
+
+
+def extract_article(html):
+    """返回 (标题, 正文)"""
+    parser = _ArticleParser()
+    parser.feed(html)
+    title = (parser.h1 or parser.title).strip()
+    return title, parser.text()
+
+
+def extract_links(html, base_url, pattern=None):
+    """提取页面中的绝对链接，可用正则过滤"""
+    parser = _ArticleParser()
+    parser.feed(html)
+    regex = re.compile(pattern) if pattern else None
+    links = []
+    for href in parser.links:
+        url = urldefrag(urljoin(base_url, href))[0]
+        if not url.startswith(('http://', 'https://')):
+            continue
+        if regex and not regex.search(url):
+            continue
+        if url not in links:
+            links.append(url)
+    return links
+
+
+class Crawler:
+    """有界连接池的并发抓取器；connector 同时限制总连接数和每个主机的并发数"""
+
+    def __init__(self, max_connections=20, per_host=4, timeout=20):
+        if aiohttp is None:
+            raise RuntimeError('未安装 aiohttp，无法抓取来源网页')
+        self.max_connections = max_connections
+        self.per_host = per_host
+        self.timeout = timeout
+
+    async def _fetch(self, session, url, etag=None, last_modified=None):
+        headers = {'User-Agent': USER_AGENT}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        try:
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304:
+                    return FetchResult(url, 304, etag=etag, last_modified=last_modified)
+                text = await response.text(errors='replace') if response.status == 200 else None
+                return FetchResult(url, response.status, text,
+                                   response.headers.get('ETag'), response.headers.get('Last-Modified'))
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            return FetchResult(url, 0, error=str(e) or type(e).__name__)
+
+    async def fetch_all(self, requests):
+        """并发抓取 [(url, etag, last_modified)]，按完成顺序逐个产出 FetchResult"""
+        connector = aiohttp.TCPConnector(limit=self.max_connections, limit_per_host=self.per_host)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            tasks = [asyncio.ensure_future(self._fetch(session, *request)) for request in requests]
+            try:
+                for task in asyncio.as_completed(tasks):
+                    yield await task
+            finally:
+                for task in tasks:
+                    task.cancel()
@@ -0,0 +1,85 @@
+"""相关文档近邻：TF-IDF 余弦相似度，分块稀疏矩阵乘法计算 top-k，支持增量更新"""
+import os
+
+import joblib
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import CountVectorizer, TfidfTransformer
+from sklearn.preprocessing import normalize
+
+CHECKPOINT_VERSION = 1
+
+
+def _identity(tokens):
+    return tokens
+
+
+class RelatedIndex:
+    def __init__(self, vocabulary):
+        self.vectorizer = CountVectorizer(analyzer=_identity, vocabulary=vocabulary, dtype=np.float32)
+        self.transformer = TfidfTransformer(sublinear_tf=True)
+        self.matrix = None               # 行归一化的 TF-IDF 矩阵（csr）
+        self.ids = np.zeros(0, dtype=np.int64)
+        self.last_policy_id = 0
+        self.trained_at = None
+
+    def fit(self, count_chunks, id_chunks):
+        """用分块计数矩阵拟合 IDF 并建立全部文档的向量"""
+        counts = sp.vstack(count_chunks).tocsr() if count_chunks else sp.csr_matrix((0, len(self.vectorizer.vocabulary)))
+        self.transformer.fit(counts)
+        self.matrix = self._weight(counts)
+        self.ids = np.concatenate(id_chunks) if id_chunks else np.zeros(0, dtype=np.int64)
+
+    def count(self, token_lists):
+        return self.vectorizer.transform(token_lists)
+
+    def _weight(self, counts):
+        return normalize(self.transformer.transform(counts), copy=False).astype(np.float32).tocsr()
+
+    def replace(self, ids, counts, removed=()):
+        """用新的向量替换（或追加）指定文档，并删除 removed 中的文档"""
+        drop = set(ids) | set(removed)
+        keep = np.array([i not in drop for i in self.ids.tolist()], dtype=bool)
+        parts = [self.matrix[keep]]
+        if len(ids):
+            parts.append(self._weight(counts))
+        self.matrix = sp.vstack(parts).tocsr()
+        self.ids = np.concatenate([self.ids[keep], np.asarray(ids, dtype=np.int64)])
+
+    def rows_of(self, ids):
+        position = {doc_id: row for row, doc_id in enumerate(self.ids.tolist())}
+        return [position[i] for i in ids if i in position]
+
+    def similarities(self, rows):
+        """rows 对全部文档的相似度（稠密块）"""
+        return (self.matrix[rows] @ self.matrix.T).toarray()
+
+    def top_k(self, rows, k, block_size):
+        """分块计算每行的前 k 个近邻，逐行产出 (policy_id, [(neighbor_id, score)])"""
+        for start in range(0, len(rows), block_size):
+            block = rows[start:start + block_size]
+            sims = self.similarities(block)
+            sims[np.arange(len(block)), block] = 0
+            count = min(k, sims.shape[1] - 1)
+            if count <= 0:
+                for row in block:
+                    yield int(self.ids[row]), []
+                continue
+            best = np.argpartition(-sims, count - 1, axis=1)[:, :count]
+            for i, row in enumerate(block):
+                order = best[i][np.argsort(-sims[i, best[i]])]
+                yield int(self.ids[row]), [(int(self.ids[j]), float(sims[i, j])) for j in order if sims[i, j] > 0]
+
+    def save(self, path):
+        tmp_path = path + '.tmp'
+        joblib.dump({'version': CHECKPOINT_VERSION, 'index': self}, tmp_path)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def load(path):
+        if not os.path.exists(path):
+            return None
+        data = joblib.load(path)
+        if data.get('version') != CHECKPOINT_VERSION:
+            return None
+        return data['index']
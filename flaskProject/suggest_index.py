@@ -0,0 +1,101 @@
+"""搜索联想的内存前缀索引：有序数组 + 二分查找，支持拼音全拼与首字母前缀"""
+import bisect
+import threading
+
+try:
+    from pypinyin import lazy_pinyin, Style
+except ImportError:  # pypinyin 为可选依赖，未安装时只支持原文前缀
+    lazy_pinyin = None
+
+
+def index_keys(term):
+    """生成词条的检索键：原文、拼音全拼、拼音首字母"""
+    keys = {term.lower()}
+    if lazy_pinyin is not None:
+        full = lazy_pinyin(term, errors='default')
+        keys.add(''.join(full).lower().replace(' ', ''))
+        initials = lazy_pinyin(term, style=Style.FIRST_LETTER, errors='default')
+        keys.add(''.join(initials).lower().replace(' ', ''))
+    return keys
+
+
+class SuggestIndex:
+    def __init__(self):
+        self._keys = []      # 有序的 (检索键, 词条, 类型)
+        self._counts = {}    # (词条, 类型) -> 引用计数，用于排序
+        self._sources = {}   # 来源 -> {(词条, 类型)}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._counts)
+
+    @classmethod
+    def build(cls, sources):
+        """由 (来源, 词条列表) 一次性构建索引，检索键排序一次，比逐条 set_source 快得多"""
+        index = cls()
+        for source, entries in sources:
+            entries = {(term.strip(), kind) for term, kind in entries if term and term.strip()}
+            if not entries:
+                continue
+            index._sources[source] = entries
+            for entry in entries:
+                index._counts[entry] = index._counts.get(entry, 0) + 1
+        index._keys = sorted((key, term, kind) for term, kind in index._counts for key in index_keys(term))
+        return index
+
+    def set_source(self, source, entries):
+        """用新的词条集合替换某个来源（如一篇文档）原有的词条"""
+        entries = {(term.strip(), kind) for term, kind in entries if term and term.strip()}
+        with self._lock:
+            old = self._sources.pop(source, set())
+            for entry in old - entries:
+                self._release(entry)
+            for entry in entries - old:
+                self._acquire(entry)
+            if entries:
+                self._sources[source] = entries
+
+    def remove_source(self, source):
+        self.set_source(source, ())
+
+    def suggest(self, prefix, limit=10):
+        prefix = prefix.strip().lower()
+        if not prefix:
+            return []
+        candidates = {}
+        with self._lock:
+            start = bisect.bisect_left(self._keys, (prefix,))
+            for key, term, kind in self._keys[start:start + limit * 20]:
+                if not key.startswith(prefix):
+                    break
+                candidates[(term, kind)] = self._counts[(term, kind)]
+        ranked = sorted(candidates.items(), key=lambda item: (-item[1], len(item[0][0]), item[0][0]))
+        result = []
+        seen = set()
+        for (term, kind), _ in ranked:
+            if term in seen:
+                continue
+            seen.add(term)
+            result.append({'text': term, 'kind': kind})
+            if len(result) >= limit:
+                break
+        return result
+
+    def _acquire(self, entry):
+        count = self._counts.get(entry, 0)
+        self._counts[entry] = count + 1
+        if count == 0:
+            for key in index_keys(entry[0]):
+                bisect.insort(self._keys, (key, entry[0], entry[1]))
+
+    def _release(self, entry):
+        count = self._counts.get(entry, 0) - 1
+        if count > 0:
+            self._counts[entry] = count
+            return
+        self._counts.pop(entry, None)
+        for key in index_keys(entry[0]):
+            item = (key, entry[0], entry[1])
+            i = bisect.bisect_left(self._keys, item)
+            if i < len(self._keys) and self._keys[i] == item:
+                del self._keys[i]
@@ -0,0 +1,13 @@
+"""测试公共设置
+
+导入 app 时会连接并初始化数据库，测试中改用临时 SQLite 文件，避免触碰开发库。
+各测试模块共享同一个 app，因此在这里统一设置，而不是在每个模块中各自设置。
+"""
+import os
+import sys
+import tempfile
+
+_tmpdir = tempfile.mkdtemp()
+DATABASE_PATH = os.path.join(_tmpdir, 'app.db')
+os.environ['LIIUXUE_DATABASE_URI'] = f"sqlite:///{DATABASE_PATH}"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,148 @@
+"""来源抓取命令测试
+
+用本地 http.server 提供来源网页。处理每个请求前先从另一个连接写一次数据库：
+抓取期间如果命令持有写事务，这次写入会因锁超时失败。
+"""
+import functools
+import http.server
+import os
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from app import ChangeLog, CategoryEnum, SourceFetchState, app, db, policy_documents, policy_lda_topics
+from conftest import DATABASE_PATH
+
+pytest.importorskip('aiohttp')
+
+TOPIC_ID = 900
+PAGES = ('a.html', 'b.html', 'c.html')
+lock_errors = []
+
+
+class ProbingHandler(http.server.SimpleHTTPRequestHandler):
+    def do_GET(self):
+        # 按页面错开响应时间，保证前面的结果已交给命令处理后，后面的请求才进行写入探测
+        name = os.path.basename(self.path)
+        if name in PAGES:
+            time.sleep(0.2 * PAGES.index(name))
+        try:
+            with sqlite3.connect(DATABASE_PATH, timeout=0.5) as conn:
+                conn.execute('INSERT INTO crawl_probe (path) VALUES (?)', (self.path,))
+        except sqlite3.OperationalError as e:
+            lock_errors.append(f'{self.path}: {e}')
+        super().do_GET()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def page(title, body):
+    return f'<html><head><title>{title}</title></head><body><h1>{title}</h1><p>{body}</p></body></html>'
+
+
+def write_page(root, name, html, age):
+    path = os.path.join(root, name)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(html)
+    # http.server 按文件修改时间生成 Last-Modified，精度为秒
+    mtime = time.time() - age
+    os.utime(path, (mtime, mtime))
+
+
+def crawl(*args):
+    result = app.test_cli_runner().invoke(args=['crawl-sources', *args])
+    assert result.exit_code == 0, result.output
+    return result.output
+
+
+@pytest.fixture(scope='module')
+def site(tmp_path_factory):
+    root = str(tmp_path_factory.mktemp('site'))
+    with sqlite3.connect(DATABASE_PATH) as conn:
+        conn.execute('CREATE TABLE IF NOT EXISTS crawl_probe (path TEXT)')
+    server = http.server.ThreadingHTTPServer(
+        ('127.0.0.1', 0), functools.partial(ProbingHandler, directory=root))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f'http://127.0.0.1:{server.server_address[1]}'
+
+    for name in PAGES:
+        write_page(root, name, page(f'网页标题 {name}', f'网页正文 {name}'), age=100)
+    with app.app_context():
+        if db.session.get(policy_lda_topics, TOPIC_ID) is None:
+            db.session.add(policy_lda_topics(topic_id=TOPIC_ID, topic_name='抓取测试'))
+        for name in PAGES:
+            db.session.add(policy_documents(
+                title=f'人工标题 {name}', content=f'人工整理的正文 {name}', source_url=f'{base}/{name}',
+                topic_id=TOPIC_ID, category=CategoryEnum.News))
+        db.session.commit()
+
+    yield root, base
+    server.shutdown()
+    app.config['CRAWL_LISTING_PAGES'] = []
+
+
+def documents(base):
+    with app.app_context():
+        docs = policy_documents.query.filter(policy_documents.source_url.like(f'{base}/%')).all()
+        return {os.path.basename(doc.source_url): (doc.policy_id, doc.title, doc.content) for doc in docs}
+
+
+def fetch_states(base):
+    with app.app_context():
+        states = SourceFetchState.query.filter(SourceFetchState.url.like(f'{base}/%')).all()
+        return {os.path.basename(state.url): state.status for state in states}
+
+
+def test_first_crawl_records_baseline_only(site):
+    _, base = site
+    crawl('--no-discover')
+    # 手工整理的正文与网页提取的文本不同，首次抓取不能覆盖
+    for name, (_, title, content) in documents(base).items():
+        assert title == f'人工标题 {name}'
+        assert content == f'人工整理的正文 {name}'
+    assert fetch_states(base) == {name: 200 for name in PAGES}
+
+
+def test_unchanged_sources_are_not_modified(site):
+    _, base = site
+    crawl('--no-discover')
+    assert fetch_states(base) == {name: 304 for name in PAGES}
+
+
+def test_changed_sources_update_content_and_keep_title(site):
+    root, base = site
+    for name in PAGES:
+        write_page(root, name, page(f'改版标题 {name}', f'更新后的正文 {name}'), age=0)
+    del lock_errors[:]
+    output = crawl('--no-discover')
+
+    assert '3 篇文档内容有更新' in output
+    docs = documents(base)
+    for name, (_, title, content) in docs.items():
+        assert title == f'人工标题 {name}'
+        assert f'更新后的正文 {name}' in content
+    with app.app_context():
+        changed = {row.entity_id for row in ChangeLog.query.filter(
+            ChangeLog.entity_id.in_([policy_id for policy_id, _, _ in docs.values()]))}
+    assert changed == {policy_id for policy_id, _, _ in docs.values()}
+    # 抓取期间没有持有写事务
+    assert lock_errors == []
+
+
+def test_discovers_articles_from_listing_page(site):
+    root, base = site
+    write_page(root, 'new-1.html', page('新发现的文章', '新文章正文'), age=0)
+    write_page(root, 'list.html', '<a href="new-1.html">新</a><a href="a.html">旧</a><a href="/about">关于</a>', age=0)
+    app.config['CRAWL_LISTING_PAGES'] = [{
+        'url': f'{base}/list.html', 'link_pattern': r'/new-\d+\.html$', 'category': 'News', 'topic_id': TOPIC_ID}]
+
+    output = crawl()
+
+    assert '新增 1 篇文档' in output
+    _, title, content = documents(base)['new-1.html']
+    assert title == '新发现的文章'
+    assert '新文章正文' in content
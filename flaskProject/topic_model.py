@@ -0,0 +1,114 @@
+"""政策文档主题模型：流式分块的在线 LDA，支持检查点续训"""
+import collections
+import os
+import re
+
+import joblib
+import numpy as np
+from scipy.optimize import linear_sum_assignment
+from sklearn.decomposition import LatentDirichletAllocation
+from sklearn.feature_extraction.text import CountVectorizer
+
+try:
+    import jieba
+except ImportError:  # jieba 为可选依赖，未安装时按汉字二元组切分
+    jieba = None
+
+CHECKPOINT_VERSION = 1
+MAX_FEATURES = 20000
+MIN_DOC_FREQ = 2
+TOP_WORDS = 8
+
+_CJK_RUN = re.compile(r'[一-鿿]+')
+
+
+def tokenize(text):
+    """切分为词语列表；在进程池中执行"""
+    if not text:
+        return []
+    if jieba is not None:
+        return [w for w in jieba.lcut(text) if len(w) > 1 and _CJK_RUN.fullmatch(w)]
+    tokens = []
+    for run in _CJK_RUN.findall(text):
+        tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def _identity(tokens):
+    return tokens
+
+
+def build_vocabulary(doc_freq, max_features=MAX_FEATURES, min_df=MIN_DOC_FREQ):
+    """由文档频次计数选出词表"""
+    words = [w for w, df in doc_freq.most_common() if df >= min_df][:max_features]
+    return sorted(words)
+
+
+class TopicModel:
+    def __init__(self, vocabulary, topic_ids, n_jobs=1, batch_size=512):
+        self.vectorizer = CountVectorizer(analyzer=_identity, vocabulary=vocabulary)
+        self.lda = LatentDirichletAllocation(
+            n_components=len(topic_ids), learning_method='online',
+            batch_size=batch_size, n_jobs=n_jobs, random_state=0)
+        self.topic_ids = list(topic_ids)
+        # LDA 主题序号 -> 数据库 topic_id，首次训练后与种子主题对齐
+        self.mapping = None
+        # 续训位置：已训练的最大文档ID，以及上次训练开始的时间
+        self.last_policy_id = 0
+        self.trained_at = None
+
+    def set_n_jobs(self, n_jobs):
+        self.lda.n_jobs = n_jobs
+
+    def partial_fit(self, token_lists):
+        matrix = self.vectorizer.transform(token_lists)
+        if matrix.nnz:
+            self.lda.partial_fit(matrix)
+
+    def align_to_seed_topics(self, seed_keywords):
+        """按种子关键词在各主题中的权重做最优匹配，使 LDA 主题与已有主题名称对应"""
+        vocab = self.vectorizer.vocabulary_
+        weights = self.lda.components_ / self.lda.components_.sum(axis=1, keepdims=True)
+        score = np.zeros((len(self.topic_ids), len(self.topic_ids)))
+        for j, topic_id in enumerate(self.topic_ids):
+            columns = [vocab[w] for w in seed_keywords.get(topic_id, []) if w in vocab]
+            if columns:
+                score[:, j] = weights[:, columns].sum(axis=1)
+        rows, cols = linear_sum_assignment(-score)
+        self.mapping = {int(r): self.topic_ids[c] for r, c in zip(rows, cols)}
+
+    def top_words(self, count=TOP_WORDS):
+        """返回 {topic_id: [关键词]}"""
+        names = self.vectorizer.get_feature_names_out()
+        result = {}
+        for k, row in enumerate(self.lda.components_):
+            result[self.mapping[k]] = [str(names[i]) for i in np.argsort(row)[::-1][:count]]
+        return result
+
+    def assign(self, token_lists):
+        """返回每篇文档概率最高的 topic_id，无有效词语时为 None"""
+        matrix = self.vectorizer.transform(token_lists)
+        best = self.lda.transform(matrix).argmax(axis=1)
+        empty = np.asarray(matrix.sum(axis=1)).ravel() == 0
+        return [None if e else self.mapping[int(k)] for k, e in zip(best, empty)]
+
+    def save(self, path):
+        tmp_path = path + '.tmp'
+        joblib.dump({'version': CHECKPOINT_VERSION, 'model': self}, tmp_path)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def load(path):
+        if not os.path.exists(path):
+            return None
+        data = joblib.load(path)
+        if data.get('version') != CHECKPOINT_VERSION:
+            return None
+        return data['model']
+
+
+def count_doc_freq(token_lists, counter=None):
+    counter = counter if counter is not None else collections.Counter()
+    for tokens in token_lists:
+        counter.update(set(tokens))
+    return counter